@@ -5,32 +5,336 @@ This module is shared between the CLI entrypoint and the Flask web UI.
 from __future__ import annotations
 
 import argparse
+import importlib.util
+import io
 import os
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+import numpy as np
+
+# pandas and matplotlib are imported where they are used, so CLI runs that
+# exit early (missing CSV, no match, no plot requested) skip their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+
+class YearBudget(NamedTuple):
+    """Costs for one program year, as listed in compute_budget()["years"]."""
+
+    year: int
+    tuition_usd: float
+    rent_usd: float
+    insurance_usd: float
+    visa_usd: float
+    direct_usd: float
+    living_usd: float
+    total_usd: float
+    total_local: float
+
+
+# Column order of the per-year array built by compute_budget.
+YEAR_COLUMNS = YearBudget._fields
+
+# Per-year cost components drawn in the budget charts, bottom to top.
+COST_COMPONENTS = ("tuition_usd", "rent_usd", "insurance_usd", "visa_usd", "living_usd")
+_COMPONENT_COLORS = ("tab:blue", "tab:orange", "tab:green", "tab:red", "tab:purple")
+
+# Matplotlib's bundled copy of seaborn's "whitegrid" look (with seaborn's
+# framed legends); avoids importing seaborn just to set a style.
+_CHART_STYLE = ["seaborn-v0_8-whitegrid", {"legend.frameon": True}]
+
+# A single Agg figure (created on first use) is cleared and reused for every
+# budget chart instead of building a new pyplot figure per chart. The lock
+# serialises threaded web requests drawing on it.
+_FIG: Optional[Figure] = None
+_FIG_LOCK = threading.Lock()
+
+# Raster resolution of the saved charts; 96 dpi matches a standard screen and
+# keeps fewer pixels to filter and encode than the old 120 dpi.
+CHART_DPI = 96
+
+# savefig() options for every chart PNG (the policy charts use them too).
+# Flat-colour charts barely shrink past zlib level 3, while the default
+# level 6 costs several times the encode time.
+SAVEFIG_KWARGS = {
+    "dpi": CHART_DPI,
+    "metadata": {"Software": None},
+    "pil_kwargs": {"compress_level": 3, "optimize": False},
+}
+
+# Columns read from the cost CSV; anything else in the file is skipped.
+CSV_USECOLS = (
+    "Country",
+    "City",
+    "University",
+    "Program",
+    "Level",
+    "Duration_Years",
+    "Tuition_USD",
+    "Living_Cost_Index",
+    "Rent_USD",
+    "Visa_Fee_USD",
+    "Insurance_USD",
+    "Exchange_Rate",
+)
+
+# Whole-dollar cost columns fit float32 exactly; the index and exchange rate
+# stay float64 since they multiply every amount derived from them.
+CSV_DTYPES = {
+    "Country": "category",
+    "City": "category",
+    "University": "category",
+    "Program": "category",
+    "Level": "category",
+    "Duration_Years": "float32",
+    "Tuition_USD": "float32",
+    "Rent_USD": "float32",
+    "Visa_Fee_USD": "float32",
+    "Insurance_USD": "float32",
+    "Living_Cost_Index": "float64",
+    "Exchange_Rate": "float64",
+}
+
+# Numeric columns are parsed untyped and coerced afterwards, so a stray
+# non-numeric cell becomes 0.0 (as safe_float() would report it) instead of
+# failing the whole read.
+CSV_NUMERIC_COLS = tuple(c for c, t in CSV_DTYPES.items() if t != "category")
+
+# CSVs above this size (bytes) are parsed in chunks of CSV_CHUNKSIZE rows.
+CSV_CHUNK_THRESHOLD = 100_000_000
+CSV_CHUNKSIZE = 200_000
+
+# Parquet schema metadata key holding the "mtime_ns:size" of the CSV a
+# snapshot was built from.
+_SNAPSHOT_SOURCE_KEY = b"cost_csv_source"
+
+# Between this size and CSV_CHUNK_THRESHOLD the multi-threaded pyarrow parser
+# is tried first; below it, its thread start-up outweighs the gain.
+CSV_PYARROW_THRESHOLD = 10_000_000
+
+# Checked once without importing it, so the lazy pandas import stays cheap.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _coerce_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    import pandas as pd
+
+    for col in CSV_NUMERIC_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0).astype(CSV_DTYPES[col])
+    return df
+
+
+def _read_cost_csv(path: str) -> pd.DataFrame:
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+
+    read_kwargs = dict(
+        usecols=lambda c: c in CSV_USECOLS,
+        dtype={c: t for c, t in CSV_DTYPES.items() if c not in CSV_NUMERIC_COLS},
+        engine="c",
+        low_memory=False,
+    )
+    size = os.path.getsize(path)
+    if _HAS_PYARROW and CSV_PYARROW_THRESHOLD <= size <= CSV_CHUNK_THRESHOLD:
+        try:
+            # pyarrow needs every listed column to exist and numeric columns
+            # typed up front; a missing column (ArrowKeyError, a KeyError) or
+            # a non-numeric cell (ValueError) falls through to the C parser.
+            df = pd.read_csv(
+                path,
+                usecols=list(CSV_USECOLS),
+                dtype={c: "float64" if c in CSV_NUMERIC_COLS else t for c, t in CSV_DTYPES.items()},
+                engine="pyarrow",
+            )
+            return _coerce_numeric(df)
+        except (KeyError, ValueError):
+            pass
+    if size <= CSV_CHUNK_THRESHOLD:
+        return _coerce_numeric(pd.read_csv(path, **read_kwargs))
+
+    # Large files are parsed in typed chunks so peak memory stays close to the
+    # final frame instead of the raw text plus inferred object columns.
+    chunks = [_coerce_numeric(c) for c in pd.read_csv(path, chunksize=CSV_CHUNKSIZE, **read_kwargs)]
+    if len(chunks) == 1:
+        return chunks[0]
+    # Each chunk infers its own categories; align them so concat keeps the
+    # categorical dtype instead of falling back to object. Sorting matches the
+    # single-pass readers, so grouped tables come out in the same order.
+    for col, dtype in CSV_DTYPES.items():
+        if dtype == "category" and col in chunks[0].columns:
+            categories = union_categoricals([c[col] for c in chunks], sort_categories=True).categories
+            for c in chunks:
+                c[col] = c[col].cat.set_categories(categories)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _read_cost_table(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Read the cost table, preferring a typed Parquet snapshot of the CSV.
+
+    The snapshot is written next to the CSV on the first load and records the
+    CSV's ``(mtime_ns, size)`` in its schema metadata; it is reused only while
+    those still match, so a CSV swapped for one with an older mtime is
+    re-parsed too. Any Parquet failure (including pyarrow not being
+    installed) falls back to parsing the CSV.
+    """
+
+    import pandas as pd
+
+    snapshot = os.path.splitext(path)[0] + ".parquet"
+    source = f"{mtime_ns}:{size}".encode()
+    try:
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_schema(snapshot).metadata or {}
+        if metadata.get(_SNAPSHOT_SOURCE_KEY) == source:
+            df = pd.read_parquet(snapshot, engine="pyarrow")
+            # A snapshot written with an older CSV_DTYPES is re-parsed.
+            if all(str(df[c].dtype) == t for c, t in CSV_DTYPES.items() if c in df.columns):
+                return df
+    except Exception:
+        pass
+
+    df = _read_cost_csv(path)
+    tmp_path = f"{snapshot}.{os.getpid()}.tmp"
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _SNAPSHOT_SOURCE_KEY: source})
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, snapshot)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+
+class CostData(NamedTuple):
+    """Parsed cost CSV plus lookup helpers derived once per file version."""
+
+    df: pd.DataFrame
+    university_lower: np.ndarray
+    # Lowercase university name -> position of its first row in ``df``.
+    university_index: dict[str, int]
+    # Distinct university names, sorted, for pick lists.
+    universities: list[str]
+
 
-import matplotlib
+def _lowercase_universities(df: pd.DataFrame) -> np.ndarray:
+    import pandas as pd
 
-matplotlib.use("Agg")  # non-interactive backend for CLI and web
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+    if "University" not in df.columns:
+        return np.full(len(df), "", dtype=str)
+    names = df["University"]
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        # Lower-case each distinct name once and expand through the codes;
+        # the trailing "" is what missing values (code -1) pick up.
+        lowered = names.cat.categories.astype(str).str.lower().tolist()
+        return np.array(lowered + [""], dtype=str)[names.cat.codes.to_numpy()]
+    return names.astype("string").str.lower().fillna("").to_numpy(dtype=str)
+
+
+def _sorted_universities(df: pd.DataFrame) -> list[str]:
+    import pandas as pd
+
+    if "University" not in df.columns:
+        return []
+    names = df["University"]
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        # Categories are already unique; only used ones are listed.
+        names = names.cat.remove_unused_categories()
+        return sorted(names.cat.categories.tolist())
+    return sorted(names.dropna().unique().tolist())
+
+
+def _index_universities(df: pd.DataFrame, university_lower: np.ndarray) -> dict[str, int]:
+    """Map each lower-cased university name to the first row that has it."""
+
+    import pandas as pd
+
+    index: dict[str, int] = {}
+    names = df["University"] if "University" in df.columns else None
+    if names is not None and isinstance(names.dtype, pd.CategoricalDtype):
+        # One entry per used category instead of one per row.
+        codes, first_rows = np.unique(names.cat.codes.to_numpy(), return_index=True)
+        first_rows = first_rows[codes >= 0]
+        rows = np.sort(first_rows).tolist()
+        for i, name in zip(rows, university_lower[rows].tolist()):
+            if name:
+                index.setdefault(name, i)
+        return index
+    for i, name in enumerate(university_lower.tolist()):
+        if name:
+            index.setdefault(name, i)
+    return index
+
+
+@lru_cache(maxsize=4)
+def _load_cost_data(path: str, mtime_ns: int, size: int) -> CostData:
+    df = _read_cost_table(path, mtime_ns, size)
+    university_lower = _lowercase_universities(df)
+    return CostData(
+        df,
+        university_lower,
+        _index_universities(df, university_lower),
+        _sorted_universities(df),
+    )
+
+
+def load_cost_data(path: str) -> CostData:
+    """Load the cost CSV, reusing the parsed frame until the file changes.
+
+    The cache is keyed on the file's mtime and size, so edits to the CSV are
+    picked up on the next call. The returned DataFrame is shared between
+    callers and must not be mutated in place.
+    """
+
+    st = os.stat(path)
+    return _load_cost_data(os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
 
 def fmt(x: float) -> str:
     return f"{x:,.2f}"
 
 
-def find_university(df: pd.DataFrame, query: str) -> Optional[pd.Series]:
+def find_university(
+    df: pd.DataFrame,
+    query: str,
+    university_lower: Optional[np.ndarray] = None,
+    university_index: Optional[dict[str, int]] = None,
+) -> Optional[pd.Series]:
+    """Return the row for ``query``, matched case-insensitively.
+
+    A university whose full name equals ``query`` wins (the web UI submits
+    exact names from its dropdown); otherwise the first row whose name
+    contains ``query`` as a literal substring, never a regex, is returned.
+    ``university_lower`` and ``university_index`` are the lookup helpers
+    from :func:`load_cost_data`; the array is derived from ``df`` when not
+    given, and without the index only the substring scan runs.
+    """
+
     if "University" not in df.columns:
         return None
-    mask = df["University"].astype(str).str.contains(query, case=False, na=False)
-    matches = df[mask]
-    if matches.empty:
+    if university_index is not None:
+        idx = university_index.get(query.lower())
+        if idx is not None:
+            return df.iloc[idx]
+    if university_lower is None:
+        university_lower = _lowercase_universities(df)
+    hits = np.flatnonzero(np.char.find(university_lower, query.lower()) >= 0)
+    if hits.size == 0:
         return None
-    return matches.iloc[0]
+    return df.iloc[hits[0]]
 
 
 def safe_float(val) -> float:
+    import pandas as pd
+
     try:
         if pd.isna(val):
             return 0.0
@@ -39,6 +343,51 @@ def safe_float(val) -> float:
         return 0.0
 
 
+def _budget_years(
+    duration: int,
+    tuition: float,
+    rent_month: float,
+    insurance: float,
+    visa_fee: float,
+    living_index: float,
+    exchange_rate: float,
+    ny_living: float,
+    inflation_rate: float,
+) -> np.ndarray:
+    """Return the (duration, len(YEAR_COLUMNS)) per-year cost array."""
+
+    # Build every year at once with broadcasting instead of accumulating
+    # scalars in a Python loop.
+    year_idx = np.arange(max(duration, 0), dtype=np.float64)
+    year_tuition = np.full_like(year_idx, tuition)
+    year_rent = np.full_like(year_idx, rent_month * 12.0)
+    year_insurance = np.full_like(year_idx, insurance)
+    year_visa = np.where(year_idx == 0, visa_fee, 0.0)
+
+    direct_costs = year_tuition + year_rent + year_insurance + year_visa
+
+    # Apply standardized annual inflation only to living costs
+    living_base = ny_living * (living_index / 100.0)
+    living = living_base * (1.0 + inflation_rate) ** year_idx
+
+    year_total_usd = direct_costs + living
+    year_total_local = year_total_usd * exchange_rate
+
+    return np.column_stack(
+        (
+            year_idx + 1.0,
+            year_tuition,
+            year_rent,
+            year_insurance,
+            year_visa,
+            direct_costs,
+            living,
+            year_total_usd,
+            year_total_local,
+        )
+    )
+
+
 def compute_budget(row: pd.Series, ny_living: float, inflation_rate: float = 0.0) -> dict:
     """Compute per-year, program totals, and averages based on a CSV row and NY baseline.
 
@@ -50,7 +399,6 @@ def compute_budget(row: pd.Series, ny_living: float, inflation_rate: float = 0.0
 
     tuition_per_year = safe_float(row.get("Tuition_USD", 0.0))
     rent_month = safe_float(row.get("Rent_USD", 0.0))
-    rent_annual = rent_month * 12.0
     insurance_annual = safe_float(row.get("Insurance_USD", 0.0))
     visa_fee = safe_float(row.get("Visa_Fee_USD", 0.0))
 
@@ -64,42 +412,21 @@ def compute_budget(row: pd.Series, ny_living: float, inflation_rate: float = 0.0
     except Exception:
         inflation_rate = 0.0
 
-    years = []
-    total_usd_program = 0.0
-    total_local_program = 0.0
-    living_base = ny_living * living_multiplier
-
-    for y in range(1, duration + 1):
-        year_tuition = tuition_per_year
-        year_rent = rent_annual
-        year_insurance = insurance_annual
-        year_visa = visa_fee if y == 1 else 0.0
-
-        direct_costs = year_tuition + year_rent + year_insurance + year_visa
-
-        # Apply standardized annual inflation only to living costs
-        inflation_factor = (1.0 + inflation_rate) ** (y - 1)
-        living = living_base * inflation_factor
-
-        year_total_usd = direct_costs + living
-        year_total_local = year_total_usd * exchange_rate
-
-        years.append(
-            {
-                "year": y,
-                "tuition_usd": year_tuition,
-                "rent_usd": year_rent,
-                "insurance_usd": year_insurance,
-                "visa_usd": year_visa,
-                "direct_usd": direct_costs,
-                "living_usd": living,
-                "total_usd": year_total_usd,
-                "total_local": year_total_local,
-            }
-        )
+    years_arr = _budget_years(
+        duration,
+        tuition_per_year,
+        rent_month,
+        insurance_annual,
+        visa_fee,
+        living_index,
+        exchange_rate,
+        float(ny_living),
+        inflation_rate,
+    )
+    years = [YearBudget(int(values[0]), *values[1:]) for values in years_arr.tolist()]
 
-        total_usd_program += year_total_usd
-        total_local_program += year_total_local
+    total_usd_program = float(years_arr[:, YEAR_COLUMNS.index("total_usd")].sum())
+    total_local_program = float(years_arr[:, YEAR_COLUMNS.index("total_local")].sum())
 
     avg_year_usd = total_usd_program / duration if duration > 0 else 0.0
     avg_month_usd = total_usd_program / (duration * 12.0) if duration > 0 else 0.0
@@ -119,177 +446,175 @@ def compute_budget(row: pd.Series, ny_living: float, inflation_rate: float = 0.0
         "avg_month_usd": avg_month_usd,
         "avg_year_local": avg_year_local,
         "avg_month_local": avg_month_local,
+        # Column-oriented copy of ``years`` for the plotting helpers.
+        "_years_arr": years_arr,
+        "_years_columns": YEAR_COLUMNS,
     }
 
 
-def _ensure_years_df(result: dict) -> pd.DataFrame:
-    years_df = pd.DataFrame(result["years"])
-    if years_df.empty:
-        return years_df
-    years_df = years_df.set_index("year")
-    components = ["tuition_usd", "rent_usd", "insurance_usd", "visa_usd", "living_usd"]
-    for c in components:
-        if c not in years_df.columns:
-            years_df[c] = 0.0
-    return years_df
+def _ensure_years_arr(result: dict) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Return the per-year values of ``result`` as a 2D array plus column names.
 
+    Uses the array stored by compute_budget when present and only rebuilds
+    one from the ``years`` records for results produced elsewhere.
+    """
 
-def generate_budget_plot(result: dict, title: str, output_path: str) -> None:
-    """Generate stacked per-year cost chart (legacy helper for CLI)."""
+    if "_years_arr" in result:
+        return result["_years_arr"], result["_years_columns"]
 
-    sns.set_style("whitegrid")
-    years_df = _ensure_years_df(result)
-    if years_df.empty:
-        return
+    import pandas as pd
 
-    components = ["tuition_usd", "rent_usd", "insurance_usd", "visa_usd", "living_usd"]
-
-    plt.figure(figsize=(8, 5))
-    bottom = None
-    colors = sns.color_palette("tab10", n_colors=len(components))
-    for i, comp in enumerate(components):
-        label = comp.replace("_", " ").title()
-        if bottom is None:
-            plt.bar(
-                years_df.index,
-                years_df[comp],
-                label=label,
-                color=colors[i],
-                edgecolor="none",
-                linewidth=0,
-            )
-            bottom = years_df[comp].copy()
-        else:
-            plt.bar(
-                years_df.index,
-                years_df[comp],
-                bottom=bottom,
-                label=label,
-                color=colors[i],
-                edgecolor="none",
-                linewidth=0,
-            )
-            bottom = bottom + years_df[comp]
+    years_df = pd.DataFrame.from_records(result["years"], columns=list(YEAR_COLUMNS))
+    return years_df.fillna(0.0).to_numpy(dtype=np.float64), YEAR_COLUMNS
+
+
+def _year_columns(arr: np.ndarray, columns: tuple[str, ...], names) -> np.ndarray:
+    return arr[:, [columns.index(name) for name in names]]
+
+
+def _reset_figure(figsize: tuple[float, float]) -> Figure:
+    """Clear the shared chart figure and resize it for the next chart.
+
+    Callers must hold ``_FIG_LOCK`` until the chart has been saved.
+    """
+
+    global _FIG
+    if _FIG is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        _FIG = Figure(layout="constrained")
+        FigureCanvasAgg(_FIG)
+    _FIG.clear()
+    _FIG.set_size_inches(*figsize)
+    return _FIG
 
-    ax = plt.gca()
+
+def warm_matplotlib() -> None:
+    """Pay matplotlib's one-off start-up cost ahead of the first chart.
+
+    Importing matplotlib, loading the font cache and initialising the Agg
+    canvas take a noticeable fraction of a second in a fresh process; the
+    web UI calls this at start-up so the first request only pays for drawing.
+    """
+
+    import matplotlib.style
+
+    with _FIG_LOCK, matplotlib.style.context(_CHART_STYLE):
+        fig = _reset_figure((1, 1))
+        fig.add_subplot().set_title("warm-up")
+        fig.savefig(io.BytesIO(), format="png", **SAVEFIG_KWARGS)
+
+
+def _hide_spines(ax) -> None:
     for spine in ax.spines.values():
         spine.set_visible(False)
 
-    plt.xlabel("Year")
-    plt.ylabel("Amount (USD)")
-    plt.title(title)
-    plt.legend(title="Component", fontsize=8)
-    plt.tight_layout()
+
+def _draw_stacked_components(ax, years: np.ndarray, vals: np.ndarray) -> None:
+    # Bottom of each segment = running total of the components below it.
+    bottoms = np.zeros_like(vals)
+    np.cumsum(vals[:, :-1], axis=1, out=bottoms[:, 1:])
+    for i, comp in enumerate(COST_COMPONENTS):
+        ax.bar(
+            years,
+            vals[:, i],
+            bottom=bottoms[:, i],
+            label=comp.replace("_", " ").title(),
+            color=_COMPONENT_COLORS[i],
+            edgecolor="none",
+            linewidth=0,
+        )
+    _hide_spines(ax)
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Amount (USD)")
+    ax.legend(title="Component", fontsize=8)
+
+
+def generate_budget_plot(result: dict, title: str, output_path: str) -> None:
+    """Generate stacked per-year cost chart (legacy helper for CLI)."""
+
+    arr, columns = _ensure_years_arr(result)
+    if len(arr) == 0:
+        return
+
+    import matplotlib.style
+
+    years = arr[:, columns.index("year")]
+    vals = _year_columns(arr, columns, COST_COMPONENTS)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    plt.savefig(output_path, dpi=120)
-    plt.close()
+    with _FIG_LOCK, matplotlib.style.context(_CHART_STYLE):
+        fig = _reset_figure((8, 5))
+        ax = fig.add_subplot()
+        _draw_stacked_components(ax, years, vals)
+        ax.set_title(title)
+        fig.savefig(output_path, **SAVEFIG_KWARGS)
 
 
 def generate_insight_charts(result: dict, output_dir: str, base_name: str = "budget") -> dict:
-    """Generate multiple charts for richer insight.
+    """Generate the budget insight charts as one stacked figure.
+
+    The figure holds three panels, top to bottom:
+      - stacked bar of component costs per year (USD)
+      - line chart of total USD cost per year
+      - bar chart of total program cost by component
+    Rendering them into one image pays the layout and PNG encode cost once.
 
-    Returns dict with keys:
-      - stacked: stacked bar of component costs per year (USD)
-      - totals_line: line chart of total USD cost per year
-      - components_share: bar chart of total program cost by component
-    Paths returned are filenames (not full paths) so they can be used with url_for(static,...).
+    Returns dict with key ``overview`` mapping to the filename (not full path)
+    so it can be used with url_for(static,...).
     """
 
     os.makedirs(output_dir, exist_ok=True)
-    sns.set_style("whitegrid")
-    years_df = _ensure_years_df(result)
-    if years_df.empty:
+    arr, columns = _ensure_years_arr(result)
+    if len(arr) == 0:
         return {}
 
-    components = ["tuition_usd", "rent_usd", "insurance_usd", "visa_usd", "living_usd"]
-    filenames: dict[str, str] = {}
-
-    # 1) Stacked bar components per year
-    stacked_name = f"{base_name}_stacked.png"
-    plt.figure(figsize=(7.5, 4.5))
-    bottom = None
-    colors = sns.color_palette("tab10", n_colors=len(components))
-    for i, comp in enumerate(components):
-        label = comp.replace("_", " ").title()
-        if bottom is None:
-            plt.bar(
-                years_df.index,
-                years_df[comp],
-                label=label,
-                color=colors[i],
-                edgecolor="none",
-                linewidth=0,
-            )
-            bottom = years_df[comp].copy()
-        else:
-            plt.bar(
-                years_df.index,
-                years_df[comp],
-                bottom=bottom,
-                label=label,
-                color=colors[i],
-                edgecolor="none",
-                linewidth=0,
-            )
-            bottom = bottom + years_df[comp]
-    ax = plt.gca()
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    plt.xlabel("Year")
-    plt.ylabel("Amount (USD)")
-    plt.title("Annual cost breakdown by component")
-    plt.legend(title="Component", fontsize=8)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, stacked_name), dpi=120)
-    plt.close()
-    filenames["stacked"] = stacked_name
-
-    # 2) Total USD per year line chart
-    totals_name = f"{base_name}_totals.png"
-    plt.figure(figsize=(7.0, 3.8))
-    plt.plot(years_df.index, years_df["total_usd"], marker="o", color="#38bdf8")
-    ax = plt.gca()
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    plt.xlabel("Year")
-    plt.ylabel("Total cost (USD)")
-    plt.title("Total program cost per year (USD)")
-    plt.grid(alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, totals_name), dpi=120)
-    plt.close()
-    filenames["totals_line"] = totals_name
-
-    # 3) Component share across full program (sum per component)
-    share_name = f"{base_name}_components.png"
-    comp_totals = {c: float(years_df[c].sum()) for c in components}
-    comp_labels = [c.replace("_", " ").title() for c in components]
-    comp_values = [comp_totals[c] for c in components]
-
-    plt.figure(figsize=(7.0, 3.8))
-    bars = plt.bar(
-        comp_labels,
-        comp_values,
-        color="#0ea5e9",
-        edgecolor="none",
-        linewidth=0,
-    )
-    ax = plt.gca()
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    plt.ylabel("Total over program (USD)")
-    plt.title("Program cost composition by component")
-    plt.xticks(rotation=15, ha="right")
-    for b in bars:
-        height = b.get_height()
-        plt.text(b.get_x() + b.get_width() / 2, height, fmt(height), ha="center", va="bottom", fontsize=7)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, share_name), dpi=120)
-    plt.close()
-    filenames["components_share"] = share_name
+    import matplotlib.style
+
+    years = arr[:, columns.index("year")]
+    vals = _year_columns(arr, columns, COST_COMPONENTS)
+    overview_name = f"{base_name}_insights.png"
+
+    with _FIG_LOCK, matplotlib.style.context(_CHART_STYLE):
+        fig = _reset_figure((7.5, 12.1))
+        ax_stacked, ax_totals, ax_share = fig.subplots(3, 1, height_ratios=(4.5, 3.8, 3.8))
+
+        # 1) Stacked bar components per year
+        _draw_stacked_components(ax_stacked, years, vals)
+        ax_stacked.set_title("Annual cost breakdown by component")
+
+        # 2) Total USD per year line chart
+        ax_totals.plot(years, arr[:, columns.index("total_usd")], marker="o", color="#38bdf8")
+        _hide_spines(ax_totals)
+        ax_totals.set_xlabel("Year")
+        ax_totals.set_ylabel("Total cost (USD)")
+        ax_totals.set_title("Total program cost per year (USD)")
+        ax_totals.grid(alpha=0.3)
+
+        # 3) Component share across full program (sum per component)
+        comp_labels = [c.replace("_", " ").title() for c in COST_COMPONENTS]
+        comp_values = vals.sum(axis=0).tolist()
+        bars = ax_share.bar(
+            comp_labels,
+            comp_values,
+            color="#0ea5e9",
+            edgecolor="none",
+            linewidth=0,
+        )
+        _hide_spines(ax_share)
+        ax_share.set_ylabel("Total over program (USD)")
+        ax_share.set_title("Program cost composition by component")
+        for label in ax_share.get_xticklabels():
+            label.set_rotation(15)
+            label.set_horizontalalignment("right")
+        for b in bars:
+            height = b.get_height()
+            ax_share.text(b.get_x() + b.get_width() / 2, height, fmt(height), ha="center", va="bottom", fontsize=7)
+
+        fig.savefig(os.path.join(output_dir, overview_name), **SAVEFIG_KWARGS)
 
-    return filenames
+    return {"overview": overview_name}
 
 
 def main() -> None:
@@ -318,10 +643,11 @@ def main() -> None:
         print(f"CSV file not found: {args.csv}")
         return
 
-    df = pd.read_csv(args.csv)
+    data = load_cost_data(args.csv)
+    df = data.df
     print(f"Loaded {len(df)} rows; columns: {list(df.columns)}")
 
-    row = find_university(df, args.university)
+    row = find_university(df, args.university, data.university_lower, data.university_index)
     if row is None:
         print(f"No university match found for query: {args.university}")
         if "University" in df.columns:
@@ -354,9 +680,9 @@ def main() -> None:
     print("-" * len(header))
     for y in result["years"]:
         print(
-            f"{y['year']:>4}  {fmt(y['tuition_usd']):>14}  {fmt(y['rent_usd']):>12}  "
-            f"{fmt(y['insurance_usd']):>15}  {fmt(y['visa_usd']):>10}  {fmt(y['living_usd']):>12}  "
-            f"{fmt(y['total_usd']):>12}  {fmt(y['total_local']):>14}"
+            f"{y.year:>4}  {fmt(y.tuition_usd):>14}  {fmt(y.rent_usd):>12}  "
+            f"{fmt(y.insurance_usd):>15}  {fmt(y.visa_usd):>10}  {fmt(y.living_usd):>12}  "
+            f"{fmt(y.total_usd):>12}  {fmt(y.total_local):>14}"
         )
 
     print("\nProgram totals:")
@@ -8,16 +8,98 @@ identify where additional support or subsidies may be needed.
 from __future__ import annotations
 
 import os
-from typing import Dict
+import threading
+from typing import Dict, Tuple
 
 import matplotlib
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
-from feature.budget_planning import safe_float
+from .budget_planning import SAVEFIG_KWARGS
+
+
+# One reusable Agg figure per subplot grid, cleared between renders, so each
+# request skips pyplot's figure manager and canvas set-up. Charts are drawn
+# under _FIG_LOCK because the cached figures are shared between threads.
+_FIG_CACHE: Dict[Tuple[int, int], Figure] = {}
+_FIG_LOCK = threading.Lock()
+
+# Resolved once at import: the seaborn style is applied as an rc context per
+# render (leaving global rcParams alone) and the colormap is looked up once.
+_CHART_STYLE = sns.axes_style("whitegrid")
+_RDYLGN = matplotlib.colormaps["RdYlGn"]
+
+_SUBPLOT_PARAMS = ("left", "bottom", "right", "top", "wspace", "hspace")
+
+
+def _figure(nrows: int, ncols: int, figsize: Tuple[float, float], **subplot_kw):
+    """Return the cleared cached figure for an ``nrows`` x ``ncols`` grid and its axes."""
+
+    fig = _FIG_CACHE.get((nrows, ncols))
+    if fig is None:
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        _FIG_CACHE[(nrows, ncols)] = fig
+    fig.clear()
+    # clear() keeps the margins tight_layout() set on the previous render.
+    fig.subplots_adjust(**{k: matplotlib.rcParams[f"figure.subplot.{k}"] for k in _SUBPLOT_PARAMS})
+    fig.set_size_inches(*figsize)
+    return fig, fig.subplots(nrows, ncols, **subplot_kw)
+
+
+def _numeric_column(df: pd.DataFrame, col: str, default: float) -> np.ndarray:
+    """Vectorized ``safe_float(row.get(col, default))`` over a whole column.
+
+    A missing column yields ``default``; unparseable or missing cells yield 0.0.
+    Costs are stored as float32 at load time (exact for whole dollars) and
+    widened here, so the derived totals, ratios and scenarios are computed in
+    float64.
+    """
+
+    if col not in df.columns:
+        return np.full(len(df), default, dtype=np.float64)
+    return pd.to_numeric(df[col], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+
+
+def _policy_costs(
+    tuition: np.ndarray,
+    rent_month: np.ndarray,
+    insurance: np.ndarray,
+    visa_fee: np.ndarray,
+    duration: np.ndarray,
+    living_index: np.ndarray,
+    ny_living: float,
+):
+    """Return the (direct, indirect, total) annual cost arrays."""
+
+    direct_annual = tuition + rent_month * 12.0 + insurance + visa_fee / np.maximum(duration, 1)
+    indirect_annual = ny_living * (living_index / 100.0)
+    return direct_annual, indirect_annual, direct_annual + indirect_annual
+
+
+def _nonzero(values: np.ndarray) -> np.ndarray:
+    """``values`` with exact zeros swapped for 1e-9, for use as a divisor."""
+
+    return np.where(values == 0, 1e-9, values)
+
+
+def _affordability_index(total: np.ndarray) -> np.ndarray:
+    """Rescale annual totals to 0–100, where 100 is the cheapest programme.
+
+    All-equal totals map to the neutral midpoint 50.
+    """
+
+    min_total = total.min()
+    max_total = total.max()
+    if max_total > min_total:
+        return 100.0 * (max_total - total) / (max_total - min_total)
+    return np.full_like(total, 50.0)
 
 
 def build_policy_frame(df: pd.DataFrame, ny_living: float) -> pd.DataFrame:
@@ -31,54 +113,49 @@ def build_policy_frame(df: pd.DataFrame, ny_living: float) -> pd.DataFrame:
     - policy_gap_usd: deviation from median cost for the same study level
     """
 
-    records = []
-
-    for _, row in df.iterrows():
-        duration = int(safe_float(row.get("Duration_Years", 1)) or 1)
-        tuition = safe_float(row.get("Tuition_USD", 0.0))
-        rent_month = safe_float(row.get("Rent_USD", 0.0))
-        insurance = safe_float(row.get("Insurance_USD", 0.0))
-        visa_fee = safe_float(row.get("Visa_Fee_USD", 0.0))
-        living_index = safe_float(row.get("Living_Cost_Index", 100.0))
-        exchange_rate = safe_float(row.get("Exchange_Rate", 1.0))
-
-        direct_annual = tuition + rent_month * 12.0 + insurance + visa_fee / max(duration, 1)
-        indirect_annual = ny_living * (living_index / 100.0)
-        total_annual = direct_annual + indirect_annual
-
-        records.append(
-            {
-                "Country": row.get("Country"),
-                "City": row.get("City"),
-                "University": row.get("University"),
-                "Program": row.get("Program"),
-                "Level": row.get("Level"),
-                "Duration_Years": duration,
-                "Tuition_USD": tuition,
-                "Rent_USD": rent_month,
-                "Insurance_USD": insurance,
-                "Visa_Fee_USD": visa_fee,
-                "Living_Cost_Index": living_index,
-                "Exchange_Rate": exchange_rate,
-                "direct_annual_usd": direct_annual,
-                "indirect_annual_usd": indirect_annual,
-                "total_annual_usd": total_annual,
-            }
-        )
+    if df.empty:
+        return pd.DataFrame()
+
+    duration_raw = _numeric_column(df, "Duration_Years", 1.0)
+    # Mirrors int(safe_float(value) or 1): missing/zero -> 1, else truncated.
+    duration = np.where(duration_raw == 0, 1.0, np.trunc(duration_raw)).astype(np.int64)
+    tuition = _numeric_column(df, "Tuition_USD", 0.0)
+    rent_month = _numeric_column(df, "Rent_USD", 0.0)
+    insurance = _numeric_column(df, "Insurance_USD", 0.0)
+    visa_fee = _numeric_column(df, "Visa_Fee_USD", 0.0)
+    living_index = _numeric_column(df, "Living_Cost_Index", 100.0)
+    exchange_rate = _numeric_column(df, "Exchange_Rate", 1.0)
+
+    direct_annual, indirect_annual, total_annual = _policy_costs(
+        tuition, rent_month, insurance, visa_fee, duration, living_index, float(ny_living)
+    )
 
-    frame = pd.DataFrame.from_records(records)
-    if frame.empty:
-        return frame
+    columns = {
+        col: (df[col].reset_index(drop=True) if col in df.columns else None)
+        for col in ("Country", "City", "University", "Program", "Level")
+    }
+    columns.update(
+        {
+            "Duration_Years": duration,
+            "Tuition_USD": tuition,
+            "Rent_USD": rent_month,
+            "Insurance_USD": insurance,
+            "Visa_Fee_USD": visa_fee,
+            "Living_Cost_Index": living_index,
+            "Exchange_Rate": exchange_rate,
+            "direct_annual_usd": direct_annual,
+            "indirect_annual_usd": indirect_annual,
+            "total_annual_usd": total_annual,
+        }
+    )
+    frame = pd.DataFrame(columns, index=pd.RangeIndex(len(df)))
 
-    min_total = float(frame["total_annual_usd"].min())
-    max_total = float(frame["total_annual_usd"].max())
-    if max_total > min_total:
-        frame["affordability_index"] = 100.0 * (max_total - frame["total_annual_usd"]) / (max_total - min_total)
-    else:
-        frame["affordability_index"] = 50.0
+    frame["affordability_index"] = _affordability_index(total_annual)
 
-    level_median = frame.groupby("Level")["total_annual_usd"].transform("median")
-    frame["policy_gap_usd"] = frame["total_annual_usd"] - level_median
+    # One median per level, broadcast back by label (NaN levels stay NaN).
+    level_medians = frame.groupby("Level", observed=True)["total_annual_usd"].median()
+    level_median = level_medians.reindex(frame["Level"]).to_numpy(dtype=np.float64)
+    frame["policy_gap_usd"] = total_annual - level_median
 
     return frame
 
@@ -121,7 +198,7 @@ def summarize_policy_insights(frame: pd.DataFrame) -> Dict[str, pd.DataFrame]:
 
     policy_gap = (
         frame.assign(above_median=frame["policy_gap_usd"] > 0)
-        .groupby(["Country", "Level"], as_index=False)
+        .groupby(["Country", "Level"], as_index=False, observed=True)
         .agg(
             avg_total_annual_usd=("total_annual_usd", "mean"),
             avg_affordability_index=("affordability_index", "mean"),
@@ -130,7 +207,7 @@ def summarize_policy_insights(frame: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     )
 
     comparative = (
-        frame.groupby("Country", as_index=False)["total_annual_usd"]
+        frame.groupby("Country", as_index=False, observed=True)["total_annual_usd"]
         .agg(
             min_total_annual_usd="min",
             max_total_annual_usd="max",
@@ -147,6 +224,15 @@ def summarize_policy_insights(frame: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     }
 
 
+def policy_chart_filenames(base_name: str = "policy") -> Dict[str, str]:
+    """Filenames generate_policy_charts() writes for ``base_name``, by chart name."""
+
+    return {
+        name: f"{base_name}_{name}.png"
+        for name in ("cost_components", "economic_context", "institution_program")
+    }
+
+
 def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str = "policy") -> Dict[str, str]:
     """Generate graphs for direct vs indirect cost, economic context, and program structure.
 
@@ -157,18 +243,23 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
     if frame.empty:
         return {}
 
-    sns.set_style("whitegrid")
+    with _FIG_LOCK, matplotlib.rc_context(_CHART_STYLE):
+        return _draw_policy_charts(frame, output_dir, base_name)
+
+
+def _draw_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str) -> Dict[str, str]:
     filenames: Dict[str, str] = {}
 
-    top = frame.sort_values("total_annual_usd", ascending=False).head(10).copy()
+    top = frame.nlargest(10, "total_annual_usd").copy()
     top["label"] = top["University"].astype(str) + " (" + top["Country"].astype(str) + ")"
 
     # 1) Direct vs indirect (living) annual cost components
     # Left: annual total cost split into policy-defined direct vs living-related costs
     # Right: share of direct vs living costs (composition) for the same programmes
-    cost_file = f"{base_name}_cost_components.png"
+    names = policy_chart_filenames(base_name)
+    cost_file = names["cost_components"]
     if not top.empty:
-        duration = top["Duration_Years"].replace(0, 1)
+        duration = np.maximum(top["Duration_Years"].to_numpy(), 1)
         tuition = top["Tuition_USD"]
         insurance = top["Insurance_USD"]
         visa_fee = top["Visa_Fee_USD"]
@@ -182,13 +273,13 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
         top["policy_direct_annual_usd"] = policy_direct
         top["policy_indirect_annual_usd"] = policy_indirect
 
-        denom = policy_total.replace(0, 1e-9)
+        denom = _nonzero(policy_total.to_numpy())
         top["policy_direct_share"] = policy_direct / denom
         top["policy_indirect_share"] = policy_indirect / denom
 
         y_pos = range(len(top))
         fig_height = max(4.5, 0.4 * len(top) + 2.0)
-        fig, (ax_abs, ax_share) = plt.subplots(1, 2, figsize=(11, fig_height), sharey=True)
+        fig, (ax_abs, ax_share) = _figure(1, 2, (11, fig_height), sharey=True)
 
         # Absolute stacked annual cost (policy-defined direct vs living)
         ax_abs.barh(y_pos, top["policy_direct_annual_usd"], color="#0ea5e9", label="Direct costs (tuition, visa, insurance)")
@@ -223,16 +314,15 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
         ax_share.xaxis.set_major_formatter(matplotlib.ticker.PercentFormatter(1.0))
         ax_share.set_title("Composition: direct vs living")
 
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, cost_file), dpi=120)
-        plt.close(fig)
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, cost_file), **SAVEFIG_KWARGS)
         filenames["cost_components"] = cost_file
 
     # 2) Economic context: living-cost index by country, coloured by affordability
-    eco_file = f"{base_name}_economic_context.png"
+    eco_file = names["economic_context"]
     eco = (
         frame.dropna(subset=["Country"])
-        .groupby("Country", as_index=False)
+        .groupby("Country", as_index=False, observed=True)
         .agg(
             living_index=("Living_Cost_Index", "mean"),
             affordability=("affordability_index", "mean"),
@@ -249,10 +339,10 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
             vmax=float(eco["affordability"].max()),
         )
         # Green = more affordable (higher index), red = less affordable
-        cmap = plt.cm.get_cmap("RdYlGn")
+        cmap = _RDYLGN
         colors = cmap(norm(eco["affordability"].values))
 
-        fig, ax = plt.subplots(figsize=(9, fig_height))
+        fig, ax = _figure(1, 1, (9, fig_height))
         ax.barh(y_pos, eco["living_index"], color=colors)
         ax.set_yticks(list(y_pos))
         ax.set_yticklabels(eco["Country"])
@@ -271,34 +361,40 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
         cbar.set_label("Affordability index (higher = more affordable)")
 
         fig.tight_layout()
-        fig.savefig(os.path.join(output_dir, eco_file), dpi=120)
-        plt.close(fig)
+        fig.savefig(os.path.join(output_dir, eco_file), **SAVEFIG_KWARGS)
         filenames["economic_context"] = eco_file
 
     # 3) Institutional & programme variables: level, duration, and cost efficiency
-    inst_file = f"{base_name}_institution_program.png"
+    inst_file = names["institution_program"]
 
-    # Cost per year metric for efficiency (used in multiple panels)
-    duration_all = frame["Duration_Years"].replace(0, 1)
-    frame = frame.assign(cost_per_year_usd=frame["total_annual_usd"] / duration_all)
+    # Cost per year metric for efficiency, kept as a local array rather than
+    # a new column on a copy of ``frame``
+    cost_per_year = pd.Series(
+        frame["total_annual_usd"].to_numpy() / np.maximum(frame["Duration_Years"].to_numpy(), 1),
+        index=frame.index,
+    )
 
     # Prepare aggregates for duration vs cost (median per level/duration)
     dur_curve = (
-        frame.groupby(["Duration_Years", "Level"], as_index=False)["total_annual_usd"]
+        frame.groupby(["Duration_Years", "Level"], as_index=False, observed=True)["total_annual_usd"]
         .median()
         .rename(columns={"total_annual_usd": "median_total_annual_usd"})
         .sort_values(["Duration_Years", "Level"])
     )
 
     # Prepare cost-per-year ranking (top 15 most expensive per year)
-    eff = frame.sort_values("cost_per_year_usd", ascending=False).head(15).copy()
+    eff_cost = cost_per_year.nlargest(15)
+    eff = frame.loc[eff_cost.index].copy()
     eff["eff_label"] = eff["Program"].astype(str) + " (" + eff["Country"].astype(str) + ")"
 
-    levels = list(frame["Level"].dropna().unique())
-    levels.sort()
+    # Partition by level once; the panels below look slices up by key rather
+    # than re-masking the whole frame for every level.
+    by_level = dict(tuple(frame.groupby("Level", observed=True)))
+    curve_by_level = dict(tuple(dur_curve.groupby("Level", observed=True)))
+    levels = sorted(by_level)
 
     # Layout: 2 rows x 3 columns
-    fig, axes = plt.subplots(2, 3, figsize=(13, 8))
+    fig, axes = _figure(2, 3, (13, 8))
 
     # A. Boxplot: annual cost distribution per level
     ax_box = axes[0, 0]
@@ -317,8 +413,8 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
     ax_line = axes[0, 1]
     if not dur_curve.empty:
         for lvl in levels:
-            sub = dur_curve[dur_curve["Level"] == lvl]
-            if sub.empty:
+            sub = curve_by_level.get(lvl)
+            if sub is None or sub.empty:
                 continue
             ax_line.plot(
                 sub["Duration_Years"],
@@ -336,7 +432,7 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
     ax_eff = axes[0, 2]
     if not eff.empty:
         idx_eff = range(len(eff))
-        ax_eff.barh(idx_eff, eff["cost_per_year_usd"], color="#0f766e")
+        ax_eff.barh(idx_eff, eff_cost.to_numpy(), color="#0f766e")
         ax_eff.set_yticks(list(idx_eff))
         ax_eff.set_yticklabels(eff["eff_label"], fontsize=7)
         ax_eff.invert_yaxis()
@@ -350,7 +446,7 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
             ax.axis("off")
             continue
         lvl = levels[i]
-        sub = frame[frame["Level"] == lvl].sort_values("total_annual_usd", ascending=False).head(8).copy()
+        sub = by_level[lvl].nlargest(8, "total_annual_usd").copy()
         if sub.empty:
             ax.axis("off")
             continue
@@ -365,13 +461,22 @@ def generate_policy_charts(frame: pd.DataFrame, output_dir: str, base_name: str
 
     fig.suptitle("Costs by level, duration, and programme structure", fontsize=11)
     fig.tight_layout(rect=(0, 0, 1, 0.96))
-    fig.savefig(os.path.join(output_dir, inst_file), dpi=120)
-    plt.close(fig)
+    fig.savefig(os.path.join(output_dir, inst_file), **SAVEFIG_KWARGS)
     filenames["institution_program"] = inst_file
 
     return filenames
 
 
+_SCENARIO_INPUTS = [
+    "Duration_Years",
+    "Tuition_USD",
+    "Rent_USD",
+    "Insurance_USD",
+    "Visa_Fee_USD",
+    "indirect_annual_usd",
+]
+
+
 def apply_policy_scenario(
     frame: pd.DataFrame,
     tuition_cut: float = 0.0,
@@ -381,7 +486,7 @@ def apply_policy_scenario(
 
     tuition_cut and living_subsidy are expressed as decimals (e.g. 0.2 = 20%).
     The function recalculates annual totals under the scenario and returns
-    a copy of ``frame`` with extra ``scenario_*`` columns.
+    a new frame with extra ``scenario_*`` columns; ``frame`` is not modified.
     """
 
     if frame.empty:
@@ -397,33 +502,28 @@ def apply_policy_scenario(
     except Exception:
         living_subsidy = 0.0
 
-    scen = frame.copy()
-
-    duration = scen["Duration_Years"].replace(0, 1)
-    tuition = scen["Tuition_USD"]
-    rent_month = scen["Rent_USD"]
-    insurance = scen["Insurance_USD"]
-    visa_fee = scen["Visa_Fee_USD"]
-    indirect = scen["indirect_annual_usd"]
+    # Pull the inputs out as one float64 block; the arithmetic below then runs
+    # on plain arrays without pandas index alignment or per-op Series.
+    duration, tuition, rent_month, insurance, visa_fee, indirect = (
+        frame[_SCENARIO_INPUTS].to_numpy(dtype=np.float64).T
+    )
+    duration = np.maximum(duration, 1.0)
 
     tuition_after = tuition * (1.0 - tuition_cut)
     direct_after = tuition_after + rent_month * 12.0 + insurance + visa_fee / duration
     indirect_after = indirect * (1.0 - living_subsidy)
     total_after = direct_after + indirect_after
 
-    scen["scenario_tuition_annual_usd"] = tuition_after
-    scen["scenario_direct_annual_usd"] = direct_after
-    scen["scenario_indirect_annual_usd"] = indirect_after
-    scen["scenario_total_annual_usd"] = total_after
+    affordability_after = _affordability_index(total_after)
 
-    min_total = float(total_after.min())
-    max_total = float(total_after.max())
-    if max_total > min_total:
-        scen["scenario_affordability_index"] = 100.0 * (max_total - total_after) / (max_total - min_total)
-    else:
-        scen["scenario_affordability_index"] = 50.0
-
-    return scen
+    # assign() shares the untouched columns with ``frame`` instead of deep-copying them.
+    return frame.assign(
+        scenario_tuition_annual_usd=tuition_after,
+        scenario_direct_annual_usd=direct_after,
+        scenario_indirect_annual_usd=indirect_after,
+        scenario_total_annual_usd=total_after,
+        scenario_affordability_index=affordability_after,
+    )
 
 
 def compute_target_gap_tables(
@@ -472,7 +572,7 @@ def compute_target_gap_tables(
     has_tuition = tuition_col in work.columns
     has_indirect = indirect_col in work.columns
     if has_tuition or has_indirect:
-        denom = total_series.replace(0, 1e-9)
+        denom = _nonzero(total_series.to_numpy())
         if has_tuition:
             work["tuition_share"] = work[tuition_col] / denom
         if has_indirect:
@@ -488,7 +588,7 @@ def compute_target_gap_tables(
         agg_kwargs["mean_living_share"] = ("living_share", "mean")
 
     by_country_level = (
-        work.groupby(["Country", "Level"], as_index=False)
+        work.groupby(["Country", "Level"], as_index=False, observed=True)
         .agg(**agg_kwargs)
         .sort_values("avg_gap_to_target_usd", ascending=False)
     )
@@ -1,11 +1,19 @@
 import os
 import sys
+from functools import lru_cache
 
 import pandas as pd
 from flask import Flask, render_template, request
 
+from . import config
+from .config import (
+    BASE_DIR,
+    CSV_PATH,
+    DEFAULT_INFLATION,
+    DEFAULT_NY_BASELINE,
+    STATIC_DIR,
+)
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
@@ -13,25 +21,81 @@ from feature.budget_planning import (
     compute_budget,
     find_university,
     generate_insight_charts,
+    load_cost_data,
+    warm_matplotlib,
 )
 from feature.policy_analysis import (
     apply_policy_scenario,
     build_policy_frame,
     compute_target_gap_tables,
     generate_policy_charts,
+    policy_chart_filenames,
     summarize_policy_insights,
 )
+from feature import budget_planning as budget_module, policy_analysis as policy_module
+
+
+def _csv_version() -> tuple[int, int]:
+    st = os.stat(CSV_PATH)
+    return st.st_mtime_ns, st.st_size
+
+
+def _fresh_policy_charts(base_name: str) -> dict | None:
+    """Chart filenames if every chart on disk is newer than its inputs, else None.
+
+    Inputs are the CSV plus the modules holding the baseline (views.config),
+    the drawing code and the PNG settings (feature.budget_planning), so
+    editing any of them also forces a re-render after a restart. The charts
+    are build output and not tracked, so a fresh checkout always re-renders.
+    """
+
+    charts = policy_chart_filenames(base_name)
+    inputs = (CSV_PATH, config.__file__, policy_module.__file__, budget_module.__file__)
+    try:
+        inputs_mtime = max(os.path.getmtime(p) for p in inputs)
+        if all(os.path.getmtime(os.path.join(STATIC_DIR, name)) > inputs_mtime for name in charts.values()):
+            return charts
+    except OSError:
+        pass
+    return None
 
-CSV_PATH = os.path.join(BASE_DIR, "International_Education_Costs.csv")
-VIEWS_DIR = os.path.dirname(os.path.abspath(__file__))
-STATIC_DIR = os.path.join(VIEWS_DIR, "static")
-DEFAULT_NY_BASELINE = 26000.0
-DEFAULT_INFLATION = 0.03  # 3% per year
+
+@lru_cache(maxsize=4)
+def _policy_baseline(ny_living: float, csv_mtime_ns: int, csv_size: int) -> tuple[pd.DataFrame, dict, dict]:
+    """Policy frame, summary tables and chart filenames for one CSV version.
+
+    None of these depend on the request's scenario parameters, so they are
+    computed once per (baseline, CSV version) and shared; callers must not
+    mutate the returned objects.
+    """
+
+    frame = build_policy_frame(load_cost_data(CSV_PATH).df, ny_living)
+    tables = summarize_policy_insights(frame)
+    # Charts already rendered from the same inputs (e.g. by a previous
+    # process) are served as they are instead of being drawn again.
+    charts = (not frame.empty and _fresh_policy_charts("policy")) or generate_policy_charts(
+        frame, STATIC_DIR, base_name="policy"
+    )
+    return frame, tables, charts
+
+
+def _policy_inputs(ny_living: float) -> tuple[pd.DataFrame, dict, dict]:
+    frame, tables, charts = _policy_baseline(ny_living, *_csv_version())
+    if not all(os.path.exists(os.path.join(STATIC_DIR, name)) for name in charts.values()):
+        # Chart files were removed behind our back; rebuild them.
+        _policy_baseline.cache_clear()
+        frame, tables, charts = _policy_baseline(ny_living, *_csv_version())
+    return frame, tables, charts
 
 
 def create_app() -> Flask:
     app = Flask(__name__, template_folder="templates", static_folder="static")
 
+    # Warm matplotlib at start-up rather than on the first chart request;
+    # set WARM_MPL=0 to skip (e.g. for quick scripted app creation).
+    if os.environ.get("WARM_MPL", "1") == "1":
+        warm_matplotlib()
+
     @app.route("/")
     def index():
         return render_template("home.html")
@@ -41,8 +105,9 @@ def create_app() -> Flask:
         if not os.path.exists(CSV_PATH):
             return render_template("budget_planning.html", error="CSV file not found.")
 
-        df = pd.read_csv(CSV_PATH)
-        universities = sorted(df.get("University", pd.Series(dtype=str)).dropna().unique().tolist())
+        data = load_cost_data(CSV_PATH)
+        df = data.df
+        universities = data.universities
 
         result = None
         selected_university = None
@@ -87,7 +152,7 @@ def create_app() -> Flask:
                     inflation_percent = DEFAULT_INFLATION * 100.0
 
             if not error:
-                row = find_university(df, selected_university)
+                row = find_university(df, selected_university, data.university_lower, data.university_index)
                 if row is None:
                     error = "Selected university was not found in the dataset."
                 else:
@@ -111,10 +176,7 @@ def create_app() -> Flask:
         if not os.path.exists(CSV_PATH):
             return render_template("policy_analysis.html", error="CSV file not found.")
 
-        df = pd.read_csv(CSV_PATH)
-        frame = build_policy_frame(df, DEFAULT_NY_BASELINE)
-        tables = summarize_policy_insights(frame)
-        charts = generate_policy_charts(frame, STATIC_DIR, base_name="policy")
+        frame, tables, charts = _policy_inputs(DEFAULT_NY_BASELINE)
 
         default_target = float(frame["total_annual_usd"].median()) if not frame.empty else 0.0
 
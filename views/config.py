@@ -0,0 +1,11 @@
+"""Paths and default inputs shared by the web views."""
+
+import os
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CSV_PATH = os.path.join(BASE_DIR, "International_Education_Costs.csv")
+VIEWS_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(VIEWS_DIR, "static")
+DEFAULT_NY_BASELINE = 26000.0
+DEFAULT_INFLATION = 0.03  # 3% per year